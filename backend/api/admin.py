@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count
 from .models import Transaction, Category, UserProfile
 
 
@@ -14,9 +15,10 @@ class CategoryAdmin(admin.ModelAdmin):
     list_display = ['name', 'user', 'color', 'icon', 'is_default', 'transaction_count', 'created_at']
     list_filter = ['is_default', 'created_at', 'user']
     search_fields = ['name', 'user__username', 'description']
-    readonly_fields = ['id', 'created_at', 'updated_at']
+    readonly_fields = ['id', 'uuid', 'created_at', 'updated_at']
     date_hierarchy = 'created_at'
     list_editable = ['is_default']
+    list_select_related = ['user']
     
     fieldsets = (
         ('Basic Information', {
@@ -26,15 +28,21 @@ class CategoryAdmin(admin.ModelAdmin):
             'fields': ('color', 'icon', 'is_default')
         }),
         ('Metadata', {
-            'fields': ('id', 'created_at', 'updated_at'),
+            'fields': ('id', 'uuid', 'created_at', 'updated_at'),
             'classes': ('collapse',)
         }),
     )
 
+    def get_queryset(self, request):
+        """Annotate transaction counts in one aggregate query instead of one COUNT per row"""
+        qs = super().get_queryset(request)
+        return qs.annotate(_txn_count=Count('transactions'))
+
     def transaction_count(self, obj):
         """Display number of transactions in this category"""
-        return obj.transactions.count()
+        return obj._txn_count
     transaction_count.short_description = 'Transactions'
+    transaction_count.admin_order_field = '_txn_count'
 
 
 @admin.register(Transaction)
@@ -42,21 +50,31 @@ class TransactionAdmin(admin.ModelAdmin):
     list_display = ['text', 'user', 'category', 'type', 'amount', 'date', 'created_at']
     list_filter = ['type', 'date', 'created_at', 'user', 'category']
     search_fields = ['text', 'user__username', 'category__name']
-    readonly_fields = ['id', 'created_at', 'updated_at']
+    readonly_fields = ['id', 'uuid', 'created_at', 'updated_at']
     date_hierarchy = 'date'
     list_editable = ['type']
+    list_select_related = ['user', 'category']
+    # Columns the changelist actually renders (including str() of the related user/category),
+    # plus updated_at: list_editable saves go through this queryset and only write loaded fields
+    changelist_only_fields = [
+        'id', 'text', 'type', 'amount', 'date', 'created_at', 'updated_at',
+        'user__username', 'category__name', 'category__user__username',
+    ]
     
     fieldsets = (
         ('Transaction Information', {
             'fields': ('user', 'category', 'type', 'text', 'amount', 'date')
         }),
         ('Metadata', {
-            'fields': ('id', 'created_at', 'updated_at'),
+            'fields': ('id', 'uuid', 'created_at', 'updated_at'),
             'classes': ('collapse',)
         }),
     )
-    
+
     def get_queryset(self, request):
-        """Optimize queryset with select_related"""
+        """Narrow the changelist SELECT to rendered columns; change views still load full rows"""
         qs = super().get_queryset(request)
-        return qs.select_related('user', 'category')
+        match = request.resolver_match
+        if match and match.url_name == f'{self.opts.app_label}_{self.opts.model_name}_changelist':
+            qs = qs.select_related('user', 'category__user').only(*self.changelist_only_fields)
+        return qs
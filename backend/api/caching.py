@@ -0,0 +1,61 @@
+"""
+Per-user cache versioning for read-heavy endpoints.
+
+Each user has a version counter per namespace. Cached payloads include the
+version in their key, so bumping it on writes (see signals.py) invalidates
+every older entry at once without having to find and delete them.
+"""
+import hashlib
+import time
+from urllib.parse import urlencode
+from django.core.cache import cache
+
+CATEGORY_LIST_NAMESPACE = 'cats'
+CATEGORY_LIST_TIMEOUT = 60  # seconds
+ANALYTICS_NAMESPACE = 'analytics'
+ANALYTICS_TIMEOUT = 60 * 60  # seconds
+TRANSACTION_SUMMARY_NAMESPACE = 'txsum'
+TRANSACTION_SUMMARY_TIMEOUT = 60  # seconds
+
+# Namespaces whose payloads depend on a user's categories and transactions
+USER_DATA_NAMESPACES = (CATEGORY_LIST_NAMESPACE, ANALYTICS_NAMESPACE, TRANSACTION_SUMMARY_NAMESPACE)
+
+
+def _version_key(namespace, user_id):
+    return f'{namespace}_ver:{user_id}'
+
+
+def _fresh_version():
+    # Time-based so a version lost to eviction never reuses a number older entries were stored under
+    return time.time_ns()
+
+
+def get_user_version(namespace, user_id):
+    """Current cache version for this user and namespace (created on first use)."""
+    key = _version_key(namespace, user_id)
+    version = cache.get(key)
+    if version is None:
+        version = _fresh_version()
+        cache.set(key, version, timeout=None)
+    return version
+
+
+def bump_user_version(namespace, user_id):
+    """Invalidate everything cached for this user in the namespace."""
+    key = _version_key(namespace, user_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _fresh_version(), timeout=None)
+
+
+def user_cache_key(namespace, user_id, *parts):
+    """Build a versioned cache key such as 'cats:<user_id>:<version>:<part>...'."""
+    version = get_user_version(namespace, user_id)
+    return ':'.join(str(p) for p in (namespace, user_id, version, *parts))
+
+
+def params_digest(params, exclude=()):
+    """Short, order-independent digest of query params (a QueryDict) for use as a key part."""
+    items = sorted((k, v) for k, v in params.lists() if k not in exclude)
+    return hashlib.blake2b(urlencode(items, doseq=True).encode(), digest_size=16).hexdigest()
@@ -6,12 +6,13 @@ class Command(BaseCommand):
     help = 'Delete all transactions without a user (orphaned transactions)'
 
     def handle(self, *args, **options):
-        count = Transaction.objects.filter(user__isnull=True).count()
+        # Nothing references Transaction and orphans have no owner to notify,
+        # so skip the per-row collector and issue a single DELETE.
+        queryset = Transaction.objects.filter(user__isnull=True)
+        count = queryset._raw_delete(queryset.db)
         if count > 0:
-            Transaction.objects.filter(user__isnull=True).delete()
             self.stdout.write(
                 self.style.SUCCESS(f'Successfully deleted {count} orphaned transaction(s)')
             )
         else:
             self.stdout.write(self.style.SUCCESS('No orphaned transactions found'))
-
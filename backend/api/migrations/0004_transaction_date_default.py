@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-14 19:30
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_add_user_profile_avatar'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='transaction',
+            name='date',
+            field=models.DateField(default=django.utils.timezone.localdate, help_text='Date of the transaction'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-14 19:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_transaction_date_default'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(condition=models.Q(('user__isnull', True)), fields=['user'], name='txn_orphan_idx'),
+        ),
+    ]
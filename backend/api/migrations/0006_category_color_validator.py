@@ -0,0 +1,20 @@
+# Generated by Django 6.0 on 2026-10-14 19:31
+
+import django.core.validators
+import re
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_transaction_orphan_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='category',
+            name='color',
+            field=models.CharField(default='#3B82F6', help_text='Hex color code for the category (e.g., #3B82F6)', max_length=7, validators=[django.core.validators.RegexValidator(re.compile('^#[0-9A-Fa-f]{6}$'), 'Color must be a 7-character hex code starting with # (e.g., #3B82F6)')]),
+        ),
+    ]
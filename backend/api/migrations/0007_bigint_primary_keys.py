@@ -0,0 +1,135 @@
+# Hand-written: swap the UUID primary keys of Category and Transaction for
+# BigAutoField keys while keeping the existing UUIDs as the public `uuid` column.
+#
+# Irreversible: the UUID key columns are dropped in raw SQL. The data steps have
+# no reverse code, so unapplying raises IrreversibleError before touching anything.
+
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery
+
+
+def flush_deferred_fk_checks(schema_editor):
+    """
+    Run pending deferred FK checks now; PostgreSQL refuses ALTER TABLE / CREATE INDEX
+    on a table that still has pending trigger events from row updates in this transaction.
+    """
+    schema_editor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+    schema_editor.execute('SET CONSTRAINTS ALL DEFERRED')
+
+
+def copy_ids_to_uuid(apps, schema_editor):
+    """Keep every existing UUID (and the category link) before the old keys are dropped."""
+    Category = apps.get_model('api', 'Category')
+    Transaction = apps.get_model('api', 'Transaction')
+    Category.objects.update(uuid=F('id'))
+    Transaction.objects.update(uuid=F('id'), category_uuid=F('category_id'))
+    flush_deferred_fk_checks(schema_editor)
+
+
+def relink_categories(apps, schema_editor):
+    """Point transactions at the new integer category keys via the preserved UUIDs."""
+    Category = apps.get_model('api', 'Category')
+    Transaction = apps.get_model('api', 'Transaction')
+    Transaction.objects.filter(category_uuid__isnull=False).update(
+        category_id=Subquery(
+            Category.objects.filter(uuid=OuterRef('category_uuid')).values('id')[:1]
+        )
+    )
+    flush_deferred_fk_checks(schema_editor)
+
+
+def replace_pk_sql(table):
+    """Drop the UUID primary key column and add an identity bigint key (existing rows are numbered)."""
+    return [
+        f'ALTER TABLE "{table}" DROP CONSTRAINT "{table}_pkey";',
+        f'ALTER TABLE "{table}" DROP COLUMN "id";',
+        f'ALTER TABLE "{table}" ADD COLUMN "id" bigint NOT NULL PRIMARY KEY GENERATED BY DEFAULT AS IDENTITY;',
+    ]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_category_color_validator'),
+    ]
+
+    operations = [
+        # New public uuid columns (nullable until filled) and a temporary copy of the category link
+        migrations.AddField(
+            model_name='category',
+            name='uuid',
+            field=models.UUIDField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='transaction',
+            name='uuid',
+            field=models.UUIDField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='transaction',
+            name='category_uuid',
+            field=models.UUIDField(null=True),
+        ),
+        migrations.RunPython(copy_ids_to_uuid),
+
+        # Drop the UUID foreign key so the category key can change type
+        migrations.RemoveIndex(
+            model_name='transaction',
+            name='api_transac_user_id_085b42_idx',
+        ),
+        migrations.RemoveField(
+            model_name='transaction',
+            name='category',
+        ),
+
+        # Replace both primary keys (PostgreSQL cannot cast uuid -> bigint in place)
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(replace_pk_sql('api_category')),
+                migrations.RunSQL(replace_pk_sql('api_transaction')),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name='category',
+                    name='id',
+                    field=models.BigAutoField(primary_key=True, serialize=False),
+                ),
+                migrations.AlterField(
+                    model_name='transaction',
+                    name='id',
+                    field=models.BigAutoField(primary_key=True, serialize=False),
+                ),
+            ],
+        ),
+
+        # Re-create the category foreign key against the bigint key and restore links
+        migrations.AddField(
+            model_name='transaction',
+            name='category',
+            field=models.ForeignKey(blank=True, help_text='Category this transaction belongs to', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='transactions', to='api.category'),
+        ),
+        migrations.RunPython(relink_categories),
+        migrations.RemoveField(
+            model_name='transaction',
+            name='category_uuid',
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['user', 'category'], name='api_transac_user_id_085b42_idx'),
+        ),
+
+        # Enforce the public identifiers
+        migrations.AlterField(
+            model_name='category',
+            name='uuid',
+            field=models.UUIDField(default=uuid.uuid4, editable=False, help_text='Public identifier used by the API (the integer pk stays internal)', unique=True),
+        ),
+        migrations.AlterField(
+            model_name='transaction',
+            name='uuid',
+            field=models.UUIDField(default=uuid.uuid4, editable=False, help_text='Public identifier used by the API (the integer pk stays internal)', unique=True),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 6.0 on 2026-10-15 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_bigint_primary_keys'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='transaction',
+            name='api_transac_user_id_aacb53_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='transaction',
+            name='api_transac_user_id_687bb9_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='transaction',
+            name='api_transac_user_id_085b42_idx',
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['user', '-date', '-created_at'], name='api_transac_user_id_8a777f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['user', 'type', '-date'], name='api_transac_user_id_a52d31_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['user', 'category', '-date'], name='api_transac_user_id_400886_idx'),
+        ),
+    ]
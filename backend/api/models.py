@@ -1,11 +1,16 @@
 import uuid
 import os
+import re
 from datetime import datetime
 from django.db import models
+from django.db.models import Q
 from django.contrib.auth.models import User
-from django.core.validators import MinLengthValidator, MaxLengthValidator
+from django.core.validators import MinLengthValidator, MaxLengthValidator, RegexValidator
 from django.utils import timezone
 
+# Compiled once; shared by the model field validator and therefore the serializer
+_HEX_COLOR_RE = re.compile(r'^#[0-9A-Fa-f]{6}$')
+
 
 def user_avatar_upload_to(instance, filename):
     """Store avatars as avatars/<user_id>/<uuid>.<ext> for uniqueness and cleanup."""
@@ -39,7 +44,13 @@ class UserProfile(models.Model):
 
 class Category(models.Model):
     """Category model for organizing transactions"""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.BigAutoField(primary_key=True)
+    uuid = models.UUIDField(
+        default=uuid.uuid4,
+        unique=True,
+        editable=False,
+        help_text="Public identifier used by the API (the integer pk stays internal)"
+    )
     user = models.ForeignKey(
         User, 
         on_delete=models.CASCADE, 
@@ -54,6 +65,9 @@ class Category(models.Model):
     color = models.CharField(
         max_length=7,
         default="#3B82F6",
+        validators=[
+            RegexValidator(_HEX_COLOR_RE, 'Color must be a 7-character hex code starting with # (e.g., #3B82F6)')
+        ],
         help_text="Hex color code for the category (e.g., #3B82F6)"
     )
     icon = models.CharField(
@@ -86,27 +100,27 @@ class Category(models.Model):
     def __str__(self):
         return f"{self.user.username} - {self.name}"
 
-    def clean(self):
-        """Validate category data"""
-        from django.core.exceptions import ValidationError
-        
-        # Validate color format (hex color)
-        if self.color and not self.color.startswith('#'):
-            raise ValidationError({'color': 'Color must be a valid hex color code starting with #'})
-        
-        if len(self.color) != 7:
-            raise ValidationError({'color': 'Color must be a 7-character hex code (e.g., #3B82F6)'})
+
+class TransactionType(models.TextChoices):
+    """Kind of transaction; the amount is always positive and the type gives its sign"""
+    INCOME = 'income', 'Income'
+    EXPENSE = 'expense', 'Expense'
+
+
+# Plain dict lookup for __str__ instead of get_type_display() walking the field choices
+_TYPE_LABELS = dict(TransactionType.choices)
 
 
 class Transaction(models.Model):
     """Transaction model for income and expenses"""
     
-    TRANSACTION_TYPES = [
-        ('income', 'Income'),
-        ('expense', 'Expense'),
-    ]
-    
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.BigAutoField(primary_key=True)
+    uuid = models.UUIDField(
+        default=uuid.uuid4,
+        unique=True,
+        editable=False,
+        help_text="Public identifier used by the API (the integer pk stays internal)"
+    )
     user = models.ForeignKey(
         User, 
         on_delete=models.CASCADE, 
@@ -125,8 +139,8 @@ class Transaction(models.Model):
     )
     type = models.CharField(
         max_length=10,
-        choices=TRANSACTION_TYPES,
-        default='expense',
+        choices=TransactionType.choices,
+        default=TransactionType.EXPENSE,
         help_text="Type of transaction: income or expense"
     )
     text = models.CharField(
@@ -140,7 +154,7 @@ class Transaction(models.Model):
         help_text="Transaction amount (always positive, type determines income/expense)"
     )
     date = models.DateField(
-        default=timezone.now,
+        default=timezone.localdate,
         help_text="Date of the transaction"
     )
     created_at = models.DateTimeField(auto_now_add=True)
@@ -149,14 +163,25 @@ class Transaction(models.Model):
     class Meta:
         ordering = ['-date', '-created_at']
         indexes = [
-            models.Index(fields=['user', 'date']),
-            models.Index(fields=['user', 'type']),
-            models.Index(fields=['user', 'category']),
+            # Match the list endpoint's filters and its default ORDER BY date DESC, created_at DESC,
+            # so filtered pages are read in index order without a sort step
+            models.Index(fields=['user', '-date', '-created_at']),
+            models.Index(fields=['user', 'type', '-date']),
+            models.Index(fields=['user', 'category', '-date']),
             models.Index(fields=['user', '-created_at']),
+            # Partial index used by the cleanup_transactions command
+            models.Index(fields=['user'], name='txn_orphan_idx', condition=Q(user__isnull=True)),
         ]
 
     def __str__(self):
-        return f"{self.user.username} - {self.text} - {self.get_type_display()} - {self.amount}"
+        # Only use the username when the user is already loaded: str() must not query or fail on orphans
+        if self.user_id is None:
+            owner = 'anon'
+        elif Transaction.user.is_cached(self):
+            owner = self.user.username
+        else:
+            owner = f'user#{self.user_id}'
+        return f"{owner} - {self.text} - {_TYPE_LABELS.get(self.type, self.type)} - {self.amount}"
 
     def clean(self):
         """Validate transaction data"""
@@ -173,6 +198,10 @@ class Transaction(models.Model):
             })
 
     def save(self, *args, **kwargs):
-        """Override save to run validation"""
-        self.full_clean()
+        """
+        Save without implicit validation (the serializer and admin forms already validate).
+        Pass validate=True to run full_clean() for direct ORM writes.
+        """
+        if kwargs.pop('validate', False):
+            self.full_clean()
         super().save(*args, **kwargs)
\ No newline at end of file
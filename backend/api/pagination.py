@@ -0,0 +1,22 @@
+"""
+Pagination classes for the API app.
+"""
+from django.core.paginator import Paginator as DjangoPaginator
+from rest_framework.pagination import PageNumberPagination
+
+
+class KnownCountPageNumberPagination(PageNumberPagination):
+    """
+    PageNumberPagination that can skip the COUNT(*) query.
+
+    A view that already knows the number of rows (e.g. from a cached summary)
+    sets `known_count` before paginating; otherwise the paginator counts as usual.
+    """
+    known_count = None
+
+    def django_paginator_class(self, object_list, per_page):
+        # Called by paginate_queryset() as self.django_paginator_class(queryset, page_size)
+        paginator = DjangoPaginator(object_list, per_page)
+        if self.known_count is not None:
+            paginator.count = self.known_count  # Overrides the cached_property before it runs
+        return paginator
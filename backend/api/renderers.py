@@ -0,0 +1,36 @@
+"""
+Renderers for the API app.
+"""
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# DRF's encoder covers the remaining types (Decimal, lazy strings, querysets, ...)
+_fallback_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer backed by orjson (C implementation, returns bytes directly).
+
+    orjson serializes dicts, lists, str, numbers, UUIDs and dates natively;
+    anything else goes through DRF's JSONEncoder.default, as with the stock renderer.
+    Any requested indent (renderer_context or `; indent=` in Accept) gives
+    orjson's fixed 2-space indentation.
+
+    Non-string dict keys (e.g. the int-keyed errors DRF builds for ListField
+    items) are stringified like json.dumps does, via OPT_NON_STR_KEYS.
+    Unlike the stock renderer in strict mode, NaN and infinite floats are written
+    as null instead of raising; the API's floats come from SQL sums of a numeric
+    column, which are always finite.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        option = orjson.OPT_NON_STR_KEYS
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        ret = orjson.dumps(data, default=_fallback_encoder.default, option=option)
+        # Same escaping as JSONRenderer: U+2028/U+2029 are valid JSON but break JavaScript string literals
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
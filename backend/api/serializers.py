@@ -74,7 +74,8 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
 
 class CategorySerializer(serializers.ModelSerializer):
     """Serializer for categories"""
-    user = UserSerializer(read_only=True)
+    id = serializers.UUIDField(source='uuid', read_only=True)
+    user = serializers.PrimaryKeyRelatedField(read_only=True)  # Reads user_id; no User row needed
     transaction_count = serializers.SerializerMethodField()
 
     class Meta:
@@ -86,8 +87,11 @@ class CategorySerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'user', 'created_at', 'updated_at', 'transaction_count']
 
     def get_transaction_count(self, obj):
-        """Get the number of transactions in this category"""
-        return obj.transactions.count()
+        """Get the number of transactions in this category (prefers the view's txn_count annotation)"""
+        count = getattr(obj, 'txn_count', None)
+        if count is None:
+            count = obj.transactions.count()
+        return count
 
     def validate_name(self, value):
         """Validate category name"""
@@ -95,14 +99,6 @@ class CategorySerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Category name cannot be empty")
         return value.strip()
 
-    def validate_color(self, value):
-        """Validate hex color format"""
-        if value and not value.startswith('#'):
-            raise serializers.ValidationError("Color must be a valid hex color code starting with #")
-        if value and len(value) != 7:
-            raise serializers.ValidationError("Color must be a 7-character hex code (e.g., #3B82F6)")
-        return value
-
     def create(self, validated_data):
         """Create category and assign to current user"""
         # User is set in perform_create, but this ensures it's handled correctly
@@ -111,6 +107,7 @@ class CategorySerializer(serializers.ModelSerializer):
 
 class CategoryListSerializer(serializers.ModelSerializer):
     """Lightweight serializer for category lists"""
+    id = serializers.UUIDField(source='uuid', read_only=True)
     transaction_count = serializers.SerializerMethodField()
 
     class Meta:
@@ -119,13 +116,17 @@ class CategoryListSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'transaction_count']
 
     def get_transaction_count(self, obj):
-        """Get the number of transactions in this category"""
-        return obj.transactions.count()
+        """Get the number of transactions in this category (prefers the view's txn_count annotation)"""
+        count = getattr(obj, 'txn_count', None)
+        if count is None:
+            count = obj.transactions.count()
+        return count
 
 
 class TransactionSerializer(serializers.ModelSerializer):
     """Serializer for transactions"""
-    user = UserSerializer(read_only=True)
+    id = serializers.UUIDField(source='uuid', read_only=True)
+    user = serializers.SlugRelatedField(slug_field='username', read_only=True)
     category = CategoryListSerializer(read_only=True)
     category_id = serializers.UUIDField(write_only=True, required=False, allow_null=True)
 
@@ -149,7 +150,8 @@ class TransactionSerializer(serializers.ModelSerializer):
             request = self.context.get('request')
             if request and request.user:
                 try:
-                    category = Category.objects.get(id=value, user=request.user)
+                    # Kept so create()/update() can reuse it instead of querying again
+                    self._validated_category = Category.objects.get(uuid=value, user=request.user)
                     return value
                 except Category.DoesNotExist:
                     raise serializers.ValidationError(
@@ -157,20 +159,18 @@ class TransactionSerializer(serializers.ModelSerializer):
                     )
         return value
 
-    def validate(self, attrs):
-        """Additional validation"""
-        # Ensure type is valid
-        if 'type' in attrs and attrs['type'] not in ['income', 'expense']:
-            raise serializers.ValidationError({
-                'type': 'Type must be either "income" or "expense"'
-            })
-        return attrs
+    def _get_category(self, category_id):
+        """Return the category loaded by validate_category_id, querying only if it wasn't"""
+        category = getattr(self, '_validated_category', None)
+        if category is None or category.uuid != category_id:
+            category = Category.objects.get(uuid=category_id)
+        return category
 
     def create(self, validated_data):
         """Create transaction with proper category handling"""
         category_id = validated_data.pop('category_id', None)
         if category_id:
-            validated_data['category'] = Category.objects.get(id=category_id)
+            validated_data['category'] = self._get_category(category_id)
         return super().create(validated_data)
     
     def update(self, instance, validated_data):
@@ -178,7 +178,7 @@ class TransactionSerializer(serializers.ModelSerializer):
         category_id = validated_data.pop('category_id', None)
         if category_id is not None:
             if category_id:
-                validated_data['category'] = Category.objects.get(id=category_id)
+                validated_data['category'] = self._get_category(category_id)
             else:
                 validated_data['category'] = None
         return super().update(instance, validated_data)
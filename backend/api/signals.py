@@ -1,109 +1,142 @@
 """
 Signals for the API app
 """
+import functools
 import logging
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.contrib.auth.models import User
-from .models import Category, UserProfile
+from .caching import USER_DATA_NAMESPACES, bump_user_version
+from .models import Category, Transaction, UserProfile
 
 logger = logging.getLogger(__name__)
 
-
-@receiver(post_save, sender=User)
-def ensure_user_profile(sender, instance, created, **kwargs):
-    """Ensure every user has a UserProfile (for avatar, etc.)."""
-    if created:
-        UserProfile.objects.get_or_create(user=instance)
+# Built once at import time; every new user gets a copy of these categories
+_DEFAULT_CATEGORIES = (
+    {
+        'name': 'Food & Dining',
+        'color': '#FF6B6B',
+        'icon': 'utensils',
+        'description': 'Restaurants, groceries, and food expenses',
+        'is_default': True,
+    },
+    {
+        'name': 'Transportation',
+        'color': '#4ECDC4',
+        'icon': 'car',
+        'description': 'Gas, public transport, and vehicle expenses',
+        'is_default': True,
+    },
+    {
+        'name': 'Shopping',
+        'color': '#95E1D3',
+        'icon': 'shopping-bag',
+        'description': 'General shopping and retail purchases',
+        'is_default': True,
+    },
+    {
+        'name': 'Bills & Utilities',
+        'color': '#F38181',
+        'icon': 'file-text',
+        'description': 'Electricity, water, internet, and other bills',
+        'is_default': True,
+    },
+    {
+        'name': 'Entertainment',
+        'color': '#AA96DA',
+        'icon': 'film',
+        'description': 'Movies, games, and entertainment expenses',
+        'is_default': True,
+    },
+    {
+        'name': 'Healthcare',
+        'color': '#FCBAD3',
+        'icon': 'heart',
+        'description': 'Medical expenses and healthcare',
+        'is_default': True,
+    },
+    {
+        'name': 'Education',
+        'color': '#A8E6CF',
+        'icon': 'book',
+        'description': 'Education and learning expenses',
+        'is_default': True,
+    },
+    {
+        'name': 'Salary',
+        'color': '#3B82F6',
+        'icon': 'dollar-sign',
+        'description': 'Salary and primary income',
+        'is_default': True,
+    },
+    {
+        'name': 'Freelance',
+        'color': '#10B981',
+        'icon': 'briefcase',
+        'description': 'Freelance and side income',
+        'is_default': True,
+    },
+    {
+        'name': 'Investment',
+        'color': '#8B5CF6',
+        'icon': 'trending-up',
+        'description': 'Investment returns and dividends',
+        'is_default': True,
+    },
+)
 
 
 @receiver(post_save, sender=User)
-def create_default_categories(sender, instance, created, **kwargs):
+def on_user_created(sender, instance, created, **kwargs):
     """
-    Create default categories for new users.
-    Fail-safe: registration must succeed even if this fails.
+    Set up a newly created user: UserProfile (for avatar, etc.) and default categories.
+    Single receiver so ordinary User saves (e.g. last_login updates) dispatch only once.
     """
     if not created:
         return
-    default_categories = [
-            {
-                'name': 'Food & Dining',
-                'color': '#FF6B6B',
-                'icon': 'utensils',
-                'description': 'Restaurants, groceries, and food expenses',
-                'is_default': True,
-            },
-            {
-                'name': 'Transportation',
-                'color': '#4ECDC4',
-                'icon': 'car',
-                'description': 'Gas, public transport, and vehicle expenses',
-                'is_default': True,
-            },
-            {
-                'name': 'Shopping',
-                'color': '#95E1D3',
-                'icon': 'shopping-bag',
-                'description': 'General shopping and retail purchases',
-                'is_default': True,
-            },
-            {
-                'name': 'Bills & Utilities',
-                'color': '#F38181',
-                'icon': 'file-text',
-                'description': 'Electricity, water, internet, and other bills',
-                'is_default': True,
-            },
-            {
-                'name': 'Entertainment',
-                'color': '#AA96DA',
-                'icon': 'film',
-                'description': 'Movies, games, and entertainment expenses',
-                'is_default': True,
-            },
-            {
-                'name': 'Healthcare',
-                'color': '#FCBAD3',
-                'icon': 'heart',
-                'description': 'Medical expenses and healthcare',
-                'is_default': True,
-            },
-            {
-                'name': 'Education',
-                'color': '#A8E6CF',
-                'icon': 'book',
-                'description': 'Education and learning expenses',
-                'is_default': True,
-            },
-            {
-                'name': 'Salary',
-                'color': '#3B82F6',
-                'icon': 'dollar-sign',
-                'description': 'Salary and primary income',
-                'is_default': True,
-            },
-            {
-                'name': 'Freelance',
-                'color': '#10B981',
-                'icon': 'briefcase',
-                'description': 'Freelance and side income',
-                'is_default': True,
-            },
-            {
-                'name': 'Investment',
-                'color': '#8B5CF6',
-                'icon': 'trending-up',
-                'description': 'Investment returns and dividends',
-                'is_default': True,
-            },
-        ]
+    UserProfile.objects.get_or_create(user=instance)
+    create_default_categories(instance)
+
+
+def create_default_categories(user):
+    """
+    Create default categories for a new user.
+    Fail-safe: registration must succeed even if this fails.
+    """
     try:
-        for category_data in default_categories:
-            Category.objects.create(user=instance, **category_data)
+        # Defaults are static and known-valid, so a single multi-row INSERT is safe here
+        with transaction.atomic():
+            Category.objects.bulk_create(
+                [Category(user=user, **category_data) for category_data in _DEFAULT_CATEGORIES],
+                batch_size=len(_DEFAULT_CATEGORIES),
+                ignore_conflicts=True,
+            )
     except Exception as e:
         logger.exception(
             "Failed to create default categories for user %s: %s",
-            instance.username,
+            user.username,
             e,
         )
         # Do not re-raise: allow registration to succeed without default categories
+
+
+def _bump_user_data(user_id):
+    """Invalidate everything cached from this user's categories and transactions."""
+    for namespace in USER_DATA_NAMESPACES:
+        bump_user_version(namespace, user_id)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Transaction)
+@receiver(post_delete, sender=Transaction)
+def invalidate_user_data_caches(sender, instance, using=None, **kwargs):
+    """Category lists and analytics depend on both models, so any write invalidates the owner's entries."""
+    # Rows removed by deleting their user (instance or queryset): nothing cached is worth keeping valid
+    origin = kwargs.get('origin')
+    if isinstance(origin, User) or getattr(origin, 'model', None) is User:
+        return
+    if instance.user_id:
+        # After commit: bumping earlier would let a concurrent read cache the old rows under the new version
+        transaction.on_commit(functools.partial(_bump_user_data, instance.user_id), using=using)
@@ -1,3 +1,73 @@
-from django.test import TestCase
+from decimal import Decimal
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from .models import Transaction
+
+
+class _Rollback(Exception):
+    pass
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class UserDataCacheInvalidationTests(TransactionTestCase):
+    """Category/transaction writes must invalidate the cached lists and ETags only once they commit."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='alice', password='secret-pass-123')
+        self.category = self.user.categories.get(name='Food & Dining')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _add_transaction(self):
+        return Transaction.objects.create(
+            user=self.user, category=self.category, text='Lunch', amount=Decimal('12.50'),
+        )
+
+    def _etags(self):
+        return (
+            self.client.get(reverse('transaction_list_create'))['ETag'],
+            self.client.get(reverse('analytics_summary'))['ETag'],
+        )
+
+    def _transaction_count(self):
+        response = self.client.get(reverse('category_list_create'))
+        self.assertEqual(response.status_code, 200)
+        counts = {row['id']: row['transaction_count'] for row in response.json()['results']}
+        return counts[str(self.category.uuid)]
+
+    def test_category_list_transaction_count_follows_writes(self):
+        self.assertEqual(self._transaction_count(), 0)
+        txn = self._add_transaction()
+        self.assertEqual(self._transaction_count(), 1)
+        txn.delete()
+        self.assertEqual(self._transaction_count(), 0)
+
+    def test_etags_change_after_commit(self):
+        before = self._etags()
+        with transaction.atomic():
+            self._add_transaction()
+            self.assertEqual(self._etags(), before)
+        after = self._etags()
+        self.assertNotEqual(after[0], before[0])
+        self.assertNotEqual(after[1], before[1])
+
+    def test_etags_unchanged_after_rollback(self):
+        before = self._etags()
+        with self.assertRaises(_Rollback):
+            with transaction.atomic():
+                self._add_transaction()
+                raise _Rollback
+        self.assertEqual(self._etags(), before)
+        self.assertFalse(Transaction.objects.filter(user=self.user).exists())
+
+    def test_matching_if_none_match_gets_304(self):
+        for name in ('transaction_list_create', 'analytics_summary'):
+            url = reverse(name)
+            etag = self.client.get(url)['ETag']
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 304)
@@ -0,0 +1,27 @@
+"""
+Upload handlers for the API app.
+"""
+from django.core.files.uploadhandler import FileUploadHandler, SkipFile
+
+
+class MaxSizeUploadHandler(FileUploadHandler):
+    """
+    Drop any uploaded file as soon as more than `max_size` bytes of it have been
+    received, instead of letting the next handlers buffer the whole body first.
+
+    Sets `request.upload_size_exceeded = True` so the view can tell an oversized
+    upload apart from a missing one. Install it first in `request.upload_handlers`.
+    """
+
+    def __init__(self, request=None, max_size=None):
+        super().__init__(request)
+        self.max_size = max_size
+
+    def receive_data_chunk(self, raw_data, start):
+        if start + len(raw_data) > self.max_size:
+            self.request.upload_size_exceeded = True
+            raise SkipFile()
+        return raw_data  # Pass the chunk on to the storing handlers
+
+    def file_complete(self, file_size):
+        return None  # Let the next handler build the UploadedFile
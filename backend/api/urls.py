@@ -15,11 +15,11 @@ urlpatterns = [
     
     # Category endpoints (require authentication)
     path('categories/', views.CategoryListCreateView.as_view(), name='category_list_create'),
-    path('categories/<uuid:id>/', views.CategoryRetrieveUpdateDestroyView.as_view(), name='category_detail'),
+    path('categories/<uuid:uuid>/', views.CategoryRetrieveUpdateDestroyView.as_view(), name='category_detail'),
     
     # Transaction endpoints (require authentication)
     path('transactions/', views.TransactionListCreateView.as_view(), name='transaction_list_create'),
-    path('transactions/<uuid:id>/', views.TransactionRetrieveUpdateDestroyView.as_view(), name='transaction_detail'),
+    path('transactions/<uuid:uuid>/', views.TransactionRetrieveUpdateDestroyView.as_view(), name='transaction_detail'),
 
     # Analytics (require authentication)
     path('analytics/summary/', views.analytics_summary, name='analytics_summary'),
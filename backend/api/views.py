@@ -3,12 +3,29 @@ from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework import generics, status, permissions, filters
 from rest_framework.decorators import api_view, permission_classes
 from django.contrib.auth.models import User
-from django.db.models import Q, Sum, Count
-from django.db.models.functions import TruncMonth
+from django.core.cache import cache
+from django.db.models import Q, Sum, Count, Prefetch, OuterRef, Subquery, IntegerField, FloatField, Value
+from django.db.models.functions import TruncMonth, Coalesce, Cast
 from django.utils import timezone
-from datetime import datetime, timedelta
-from collections import defaultdict
-from .models import Transaction, Category, UserProfile
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+import hashlib
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal, InvalidOperation
+from operator import itemgetter
+from .caching import (
+    ANALYTICS_NAMESPACE,
+    ANALYTICS_TIMEOUT,
+    CATEGORY_LIST_NAMESPACE,
+    CATEGORY_LIST_TIMEOUT,
+    TRANSACTION_SUMMARY_NAMESPACE,
+    TRANSACTION_SUMMARY_TIMEOUT,
+    params_digest,
+    user_cache_key,
+)
+from .models import Transaction, TransactionType, Category, UserProfile
+from .pagination import KnownCountPageNumberPagination
 from .serializers import (
     TransactionSerializer, 
     CustomTokenObtainPairSerializer,
@@ -17,6 +34,7 @@ from .serializers import (
     CategorySerializer,
     CategoryListSerializer
 )
+from .uploadhandlers import MaxSizeUploadHandler
 
 
 class RegisterView(generics.CreateAPIView):
@@ -45,9 +63,8 @@ class CustomTokenObtainPairView(TokenObtainPairView):
 @permission_classes([permissions.IsAuthenticated])
 def get_user_profile(request):
     """Get current user profile (includes avatar URL)."""
-    UserProfile.objects.get_or_create(user=request.user)
-    user = User.objects.select_related('profile').get(pk=request.user.pk)
-    serializer = UserSerializer(user, context={'request': request})
+    # request.user is already loaded; only the profile is fetched (it exists from the post_save signal)
+    serializer = UserSerializer(request.user, context={'request': request})
     return Response(serializer.data)
 
 
@@ -55,11 +72,11 @@ def get_user_profile(request):
 @permission_classes([permissions.IsAuthenticated])
 def update_user_profile(request):
     """Update current user profile (text fields only; use avatar endpoint for picture)."""
-    serializer = UserSerializer(request.user, data=request.data, partial=True)
+    serializer = UserSerializer(request.user, data=request.data, partial=True, context={'request': request})
     if serializer.is_valid():
+        # save() updates request.user in place, so it can be serialized without selecting it again
         serializer.save()
-        user = User.objects.select_related('profile').get(pk=request.user.pk)
-        return Response(UserSerializer(user, context={'request': request}).data)
+        return Response(serializer.data)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -85,7 +102,8 @@ def change_password(request):
     except ValidationError as e:
         return Response({'new_password': list(e.messages)}, status=status.HTTP_400_BAD_REQUEST)
     request.user.set_password(new_password)
-    request.user.save()
+    # Only the hash changed; don't rewrite the rest of the auth_user row
+    request.user.save(update_fields=['password'])
     return Response({'message': 'Password updated successfully.'})
 
 
@@ -95,27 +113,42 @@ AVATAR_MAX_DIMENSION = 512
 ALLOWED_IMAGE_CONTENT_TYPES = {'image/jpeg', 'image/png', 'image/webp'}
 
 
+def _get_profile(user):
+    """
+    The user's profile: normally created by the post_save signal, but created here if it
+    went missing since (deleted in the admin, or a user added by loaddata/bulk_create).
+    """
+    try:
+        return user.profile
+    except UserProfile.DoesNotExist:
+        profile, _ = UserProfile.objects.get_or_create(user=user)
+        user.profile = profile  # Replace the cached miss so serializers see the new profile
+        return profile
+
+
 @api_view(['POST', 'DELETE'])
 @permission_classes([permissions.IsAuthenticated])
 def avatar(request):
     """POST: upload/replace profile picture (multipart key 'avatar'). DELETE: remove picture."""
+    profile = _get_profile(request.user)
     if request.method == 'DELETE':
-        profile, _ = UserProfile.objects.get_or_create(user=request.user)
         if profile.avatar:
             profile.avatar.delete(save=False)
             profile.avatar = None
             profile.save()
-        user = User.objects.select_related('profile').get(pk=request.user.pk)
-        return Response(UserSerializer(user, context={'request': request}).data)
+        return Response(UserSerializer(request.user, context={'request': request}).data)
 
     from PIL import Image
     from io import BytesIO
-    from django.core.files.base import ContentFile
+    from django.core.files.base import File
 
+    # Must be installed before request.FILES is first read: the body is parsed lazily
+    request.upload_handlers.insert(0, MaxSizeUploadHandler(request._request, AVATAR_MAX_SIZE_BYTES))
     avatar_file = request.FILES.get('avatar')
-    if not avatar_file:
+    too_large = getattr(request, 'upload_size_exceeded', False)
+    if not avatar_file and not too_large:
         return Response({'avatar': ['No file provided. Use form key "avatar".']}, status=status.HTTP_400_BAD_REQUEST)
-    if avatar_file.size > AVATAR_MAX_SIZE_BYTES:
+    if too_large or avatar_file.size > AVATAR_MAX_SIZE_BYTES:
         return Response(
             {'avatar': [f'File too large. Maximum size is {AVATAR_MAX_SIZE_BYTES // (1024*1024)} MB.']},
             status=status.HTTP_400_BAD_REQUEST,
@@ -129,6 +162,9 @@ def avatar(request):
 
     try:
         img = Image.open(avatar_file)
+        # JPEG only (a no-op for other formats): let libjpeg decode at 1/2, 1/4 or 1/8 scale while
+        # staying >= 2x the target, the same headroom thumbnail() keeps with its default reducing_gap
+        img.draft('RGB', (AVATAR_MAX_DIMENSION * 2, AVATAR_MAX_DIMENSION * 2))
         img.load()
     except Exception:
         return Response({'avatar': ['Invalid or corrupted image.']}, status=status.HTTP_400_BAD_REQUEST)
@@ -136,32 +172,82 @@ def avatar(request):
     if img.mode in ('RGBA', 'P'):
         img = img.convert('RGB')
     w, h = img.size
+    # Already-small images skip resampling; at this size BICUBIC is indistinguishable from LANCZOS and cheaper
     if w > AVATAR_MAX_DIMENSION or h > AVATAR_MAX_DIMENSION:
-        img.thumbnail((AVATAR_MAX_DIMENSION, AVATAR_MAX_DIMENSION), Image.Resampling.LANCZOS)
+        img.thumbnail((AVATAR_MAX_DIMENSION, AVATAR_MAX_DIMENSION), Image.Resampling.BICUBIC)
 
     buffer = BytesIO()
     img.save(buffer, format='JPEG', quality=88, optimize=True)
     buffer.seek(0)
 
-    profile, _ = UserProfile.objects.get_or_create(user=request.user)
     if profile.avatar:
         profile.avatar.delete(save=False)
-    profile.avatar.save(f'avatar_{request.user.id}.jpg', ContentFile(buffer.read()), save=True)
+    # File() hands the buffer to storage as-is (copied in chunks) instead of a second bytes copy
+    profile.avatar.save(f'avatar_{request.user.id}.jpg', File(buffer), save=True)
+
+    # request.user.profile is the instance just saved (cached by _get_profile), so no re-select is needed
+    return Response(UserSerializer(request.user, context={'request': request}).data)
 
-    user = User.objects.select_related('profile').get(pk=request.user.pk)
-    return Response(UserSerializer(user, context={'request': request}).data)
+
+# ==================== Conditional GET ====================
+
+def _user_data_etag(namespace, today_dependent=False):
+    """
+    Build an etag_func for django's @condition from the user's cache version.
+
+    The version is bumped by every category/transaction write (see signals.py),
+    so an unchanged ETag means an unchanged response and a poll can get a 304
+    without any database work.
+    """
+    def etag_func(request, *args, **kwargs):
+        # The username is rendered in every transaction row and can change without a category/transaction write
+        parts = [params_digest(request.query_params), request.META.get('HTTP_ACCEPT', ''), request.user.username]
+        if today_dependent:
+            # Default date ranges move with the calendar
+            parts.append(timezone.now().date())
+        key = user_cache_key(namespace, request.user.id, *parts)
+        return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return etag_func
 
 
 # ==================== Category Views ====================
 
+def _category_transaction_count():
+    """
+    Per-category transaction count as a correlated subquery (served by the
+    index on the Transaction.category foreign key) rather than a JOIN + GROUP BY.
+    """
+    counts = (
+        Transaction.objects.filter(category=OuterRef('pk'))
+        .order_by()
+        .values('category')
+        .annotate(c=Count('*'))
+        .values('c')
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
 class CategoryListCreateView(generics.ListCreateAPIView):
     """List and create categories (user-specific)"""
     serializer_class = CategorySerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        """Return only categories for the authenticated user, optimized with select_related"""
-        return Category.objects.filter(user=self.request.user).select_related('user')
+        """Return only categories for the authenticated user, with transaction counts annotated"""
+        return (
+            Category.objects.filter(user=self.request.user)
+            .only('id', 'uuid', 'name', 'color', 'icon', 'is_default', 'created_at', 'updated_at')
+            .annotate(txn_count=_category_transaction_count())
+        )
+
+    def list(self, request, *args, **kwargs):
+        """Serve the category list from a per-user cache (invalidated by category/transaction writes)"""
+        key = user_cache_key(CATEGORY_LIST_NAMESPACE, request.user.id, params_digest(request.query_params))
+        data = cache.get(key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(key, data, CATEGORY_LIST_TIMEOUT)
+        return Response(data)
 
     def perform_create(self, serializer):
         """Automatically assign the category to the current user"""
@@ -178,18 +264,19 @@ class CategoryRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
     """Retrieve, update, or delete a category (user-specific)"""
     serializer_class = CategorySerializer
     permission_classes = [permissions.IsAuthenticated]
-    lookup_field = 'id'
+    lookup_field = 'uuid'
 
     def get_queryset(self):
         """Return only categories for the authenticated user"""
-        return Category.objects.filter(user=self.request.user).select_related('user')
+        return Category.objects.filter(user=self.request.user)
 
     def destroy(self, request, *args, **kwargs):
         """Prevent deletion of categories that have transactions"""
         instance = self.get_object()
-        transaction_count = instance.transactions.count()
         
-        if transaction_count > 0:
+        # EXISTS stops at the first row; the exact count is only needed for the error message
+        if instance.transactions.exists():
+            transaction_count = instance.transactions.count()
             return Response(
                 {
                     'error': f'Cannot delete category with {transaction_count} transaction(s). '
@@ -203,10 +290,81 @@ class CategoryRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
 
 # ==================== Transaction Views ====================
 
+def _float_sum(**filters):
+    """
+    SUM(amount) cast to double precision in SQL (0.0 when no rows match), so
+    aggregates arrive as Python floats. The sum itself is still exact numeric.
+    """
+    total = Sum('amount', filter=Q(**filters)) if filters else Sum('amount')
+    return Coalesce(Cast(total, FloatField()), Value(0.0))
+
+
+def _parse_date_param(query_params, name, default=None):
+    """Parse a YYYY-MM-DD query param with date.fromisoformat (C implementation); default if missing or invalid."""
+    value = query_params.get(name)
+    if not value:
+        return default
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return default
+
+
+def _parse_decimal(value):
+    """Parse a query param as a finite Decimal (matching the amount column), or None if invalid."""
+    if not value:
+        return None
+    try:
+        value = Decimal(value)
+    except InvalidOperation:
+        return None
+    return value if value.is_finite() else None
+
+
+def _parse_uuid(value):
+    """Parse a query param as a UUID, or None if missing or invalid."""
+    if not value:
+        return None
+    try:
+        return uuid.UUID(value)
+    except ValueError:
+        return None
+
+
+def _parse_transaction_filters(query_params):
+    """
+    Parse the transaction list filters once into typed values (None when a param
+    is missing or invalid, so bad input is ignored rather than rejected).
+    The UUID is parsed here because the ORM only rejects a bad one when the query runs.
+    """
+    transaction_type = query_params.get('type')
+    return {
+        'type': transaction_type if transaction_type in TransactionType.values else None,
+        'category': _parse_uuid(query_params.get('category')),
+        'start_date': _parse_date_param(query_params, 'start_date'),
+        'end_date': _parse_date_param(query_params, 'end_date'),
+        'min_amount': _parse_decimal(query_params.get('min_amount')),
+        'max_amount': _parse_decimal(query_params.get('max_amount')),
+    }
+
+
+def _attach_owner(transactions, user):
+    """
+    Reuse the authenticated user (already loaded by the authentication class) as
+    each transaction's owner, so serializing `user` never fetches the same
+    auth_user row again. Callers only pass transactions filtered to this user.
+    """
+    for txn in transactions:
+        txn.user = user
+    return transactions
+
+
+@method_decorator(condition(etag_func=_user_data_etag(TRANSACTION_SUMMARY_NAMESPACE)), name='list')
 class TransactionListCreateView(generics.ListCreateAPIView):
     """List and create transactions (user-specific) with filtering and search"""
     serializer_class = TransactionSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KnownCountPageNumberPagination
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['text', 'category__name']
     ordering_fields = ['date', 'created_at', 'amount', 'type']
@@ -214,56 +372,47 @@ class TransactionListCreateView(generics.ListCreateAPIView):
 
     def get_queryset(self):
         """Return filtered transactions for the authenticated user with optimized queries"""
-        queryset = Transaction.objects.filter(
-            user=self.request.user
-        ).select_related('category', 'user').order_by('-date', '-created_at')
+        # Categories are prefetched (not joined) so their transaction counts come from one aggregate query;
+        # both querysets only load the columns TransactionSerializer / CategoryListSerializer read
+        category_qs = Category.objects.only(
+            'id', 'uuid', 'name', 'color', 'icon', 'is_default'
+        ).annotate(txn_count=_category_transaction_count())
+        params = _parse_transaction_filters(self.request.query_params)
+
+        # Collect every filter into one Q and apply it once (each .filter() call clones the queryset)
+        conditions = Q(user=self.request.user)
 
         # Filter by type (income/expense)
-        transaction_type = self.request.query_params.get('type', None)
-        if transaction_type in ['income', 'expense']:
-            queryset = queryset.filter(type=transaction_type)
+        if params['type']:
+            conditions &= Q(type=params['type'])
 
         # Filter by category
-        category_id = self.request.query_params.get('category', None)
-        if category_id:
-            try:
-                queryset = queryset.filter(category_id=category_id)
-            except ValueError:
-                pass  # Invalid UUID format
+        if params['category']:
+            conditions &= Q(category__uuid=params['category'])
 
         # Filter by date range
-        start_date = self.request.query_params.get('start_date', None)
-        end_date = self.request.query_params.get('end_date', None)
-        
-        if start_date:
-            try:
-                start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
-                queryset = queryset.filter(date__gte=start_date)
-            except ValueError:
-                pass  # Invalid date format
-
-        if end_date:
-            try:
-                end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
-                queryset = queryset.filter(date__lte=end_date)
-            except ValueError:
-                pass  # Invalid date format
+        # A single BETWEEN gives the planner both bounds of the (user, date) index range
+        start_date, end_date = params['start_date'], params['end_date']
+        if start_date and end_date:
+            conditions &= Q(date__range=(start_date, end_date))
+        elif start_date:
+            conditions &= Q(date__gte=start_date)
+        elif end_date:
+            conditions &= Q(date__lte=end_date)
 
         # Filter by amount range
-        min_amount = self.request.query_params.get('min_amount', None)
-        max_amount = self.request.query_params.get('max_amount', None)
-        
-        if min_amount:
-            try:
-                queryset = queryset.filter(amount__gte=float(min_amount))
-            except ValueError:
-                pass
-
-        if max_amount:
-            try:
-                queryset = queryset.filter(amount__lte=float(max_amount))
-            except ValueError:
-                pass
+        if params['min_amount'] is not None:
+            conditions &= Q(amount__gte=params['min_amount'])
+        if params['max_amount'] is not None:
+            conditions &= Q(amount__lte=params['max_amount'])
+
+        # The owner isn't joined: list() attaches request.user to each row instead
+        queryset = Transaction.objects.filter(conditions).only(
+            'id', 'uuid', 'type', 'text', 'amount', 'date', 'created_at', 'updated_at',
+            'category', 'user',
+        ).prefetch_related(
+            Prefetch('category', queryset=category_qs)
+        ).order_by('-date', '-created_at')
 
         return queryset
 
@@ -271,69 +420,94 @@ class TransactionListCreateView(generics.ListCreateAPIView):
         """Automatically assign the transaction to the current user"""
         serializer.save(user=self.request.user)
 
+    def get_summary(self, queryset):
+        """
+        Summary statistics for the filtered queryset, cached per user and filter set
+        (page and ordering don't change the totals, so every page reuses one entry).
+        """
+        exclude = {'ordering'}
+        if self.paginator is not None:
+            exclude.add(self.paginator.page_query_param)
+        key = user_cache_key(
+            TRANSACTION_SUMMARY_NAMESPACE,
+            self.request.user.id,
+            params_digest(self.request.query_params, exclude=exclude),
+        )
+        summary = cache.get(key)
+        if summary is not None:
+            return summary
+
+        # Calculate all summary statistics in a single aggregate query
+        stats = queryset.aggregate(
+            total_income=_float_sum(type='income'),
+            total_expense=_float_sum(type='expense'),
+            total_count=Count('id'),
+            income_count=Count('id', filter=Q(type='income')),
+            expense_count=Count('id', filter=Q(type='expense')),
+        )
+        summary = {
+            'total_income': stats['total_income'],
+            'total_expense': stats['total_expense'],
+            # Rounded to cents so float subtraction can't show artifacts like 0.30000000000000004
+            'balance': round(stats['total_income'] - stats['total_expense'], 2),
+            'total_count': stats['total_count'],
+            'income_count': stats['income_count'],
+            'expense_count': stats['expense_count'],
+        }
+        cache.set(key, summary, TRANSACTION_SUMMARY_TIMEOUT)
+        return summary
+
     def list(self, request, *args, **kwargs):
         """Enhanced list view with summary statistics"""
-        response = super().list(request, *args, **kwargs)
-        
-        # Get filtered queryset for statistics (before pagination)
+        # Built once and shared by the summary (before pagination) and the page itself
         queryset = self.filter_queryset(self.get_queryset())
-        
-        # Calculate summary statistics
-        total_income = queryset.filter(type='income').aggregate(
-            total=Sum('amount')
-        )['total'] or 0
-        
-        total_expense = queryset.filter(type='expense').aggregate(
-            total=Sum('amount')
-        )['total'] or 0
-        
-        balance = total_income - total_expense
-        
-        # Add summary to response (preserve pagination structure if present)
-        if isinstance(response.data, dict) and 'results' in response.data:
-            # Paginated response
-            response.data['summary'] = {
-                'total_income': float(total_income),
-                'total_expense': float(total_expense),
-                'balance': float(balance),
-                'total_count': queryset.count(),
-                'income_count': queryset.filter(type='income').count(),
-                'expense_count': queryset.filter(type='expense').count(),
-            }
-        else:
-            # Non-paginated response (if pagination is disabled)
-            response.data = {
-                'results': response.data,
-                'summary': {
-                    'total_income': float(total_income),
-                    'total_expense': float(total_expense),
-                    'balance': float(balance),
-                    'total_count': queryset.count(),
-                    'income_count': queryset.filter(type='income').count(),
-                    'expense_count': queryset.filter(type='expense').count(),
-                }
-            }
-        
-        return response
+        summary = self.get_summary(queryset)
+
+        # The summary already counted the rows, so the paginator doesn't need its own COUNT(*)
+        if self.paginator is not None:
+            self.paginator.known_count = summary['total_count']
+        page = self.paginate_queryset(queryset)
+
+        if page is not None:
+            _attach_owner(page, request.user)
+            # Paginated response: add summary alongside the pagination fields
+            response = self.get_paginated_response(self.get_serializer(page, many=True).data)
+            response.data['summary'] = summary
+            return response
+
+        # Non-paginated response (if pagination is disabled)
+        serializer = self.get_serializer(_attach_owner(list(queryset), request.user), many=True)
+        return Response({
+            'results': serializer.data,
+            'summary': summary,
+        })
 
 
 class TransactionRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
     """Retrieve, update, or delete a transaction (user-specific)"""
     serializer_class = TransactionSerializer
     permission_classes = [permissions.IsAuthenticated]
-    lookup_field = 'id'
+    lookup_field = 'uuid'
 
     def get_queryset(self):
         """Return only transactions for the authenticated user with optimized queries"""
+        # The nested category only renders a few columns; skip its description and timestamps
         return Transaction.objects.filter(
             user=self.request.user
-        ).select_related('category', 'user')
+        ).select_related('category').defer(
+            'category__description', 'category__created_at', 'category__updated_at',
+        )
+
+    def get_object(self):
+        """Fetch the transaction and reuse request.user as its owner instead of joining auth_user"""
+        return _attach_owner([super().get_object()], self.request.user)[0]
 
 
 # ==================== Analytics View ====================
 
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
+@condition(etag_func=_user_data_etag(ANALYTICS_NAMESPACE, today_dependent=True))
 def analytics_summary(request):
     """
     Return aggregated analytics for the authenticated user.
@@ -341,95 +515,85 @@ def analytics_summary(request):
     Default: last 12 months.
     """
     today = timezone.now().date()
-    end_date = today
-    start_date = today - timedelta(days=365)
-
-    start_param = request.query_params.get('start_date')
-    end_param = request.query_params.get('end_date')
-    if start_param:
-        try:
-            start_date = datetime.strptime(start_param, '%Y-%m-%d').date()
-        except ValueError:
-            pass
-    if end_param:
-        try:
-            end_date = datetime.strptime(end_param, '%Y-%m-%d').date()
-        except ValueError:
-            pass
+    start_date = _parse_date_param(request.query_params, 'start_date', default=today - timedelta(days=365))
+    end_date = _parse_date_param(request.query_params, 'end_date', default=today)
 
     if start_date > end_date:
         start_date, end_date = end_date, start_date
 
+    # Cached per user and period; transaction/category writes bump the user's version
+    cache_key = user_cache_key(ANALYTICS_NAMESPACE, request.user.id, start_date, end_date)
+    payload = cache.get(cache_key)
+    if payload is not None:
+        return Response(payload)
+
     base_qs = Transaction.objects.filter(
         user=request.user,
-        date__gte=start_date,
-        date__lte=end_date,
-    ).select_related('category')
-
-    total_income = base_qs.filter(type='income').aggregate(total=Sum('amount'))['total'] or 0
-    total_expense = base_qs.filter(type='expense').aggregate(total=Sum('amount'))['total'] or 0
-    balance = total_income - total_expense
-    transaction_count = base_qs.count()
-    income_count = base_qs.filter(type='income').count()
-    expense_count = base_qs.filter(type='expense').count()
-
-    expenses_by_category = (
-        base_qs.filter(type='expense', category__isnull=False)
-        .values('category__id', 'category__name', 'category__color')
-        .annotate(total=Sum('amount'), count=Count('id'))
-        .order_by('-total')
+        date__range=(start_date, end_date),
     )
-    expenses_by_category = [
-        {
-            'category_id': str(x['category__id']),
-            'category_name': x['category__name'] or 'Uncategorized',
-            'color': x['category__color'] or '#6b7280',
-            'total': float(x['total']),
-            'count': x['count'],
-        }
-        for x in expenses_by_category
-    ]
 
-    income_by_category = (
-        base_qs.filter(type='income', category__isnull=False)
-        .values('category__id', 'category__name', 'category__color')
-        .annotate(total=Sum('amount'), count=Count('id'))
-        .order_by('-total')
+    totals = base_qs.aggregate(
+        total_income=_float_sum(type='income'),
+        total_expense=_float_sum(type='expense'),
+        transaction_count=Count('id'),
+        income_count=Count('id', filter=Q(type='income')),
+        expense_count=Count('id', filter=Q(type='expense')),
     )
-    income_by_category = [
-        {
-            'category_id': str(x['category__id']),
-            'category_name': x['category__name'] or 'Uncategorized',
-            'color': x['category__color'] or '#6b7280',
-            'total': float(x['total']),
+    total_income = totals['total_income']
+    total_expense = totals['total_expense']
+    balance = round(total_income - total_expense, 2)
+    transaction_count = totals['transaction_count']
+    income_count = totals['income_count']
+    expense_count = totals['expense_count']
+
+    # One GROUP BY over (type, category); split per type and sort the (small) lists in Python.
+    # Uncategorized rows are excluded and name/color are NOT NULL, so the values need no fallbacks.
+    by_category_rows = (
+        base_qs.filter(category__isnull=False)
+        .values('type', 'category__uuid', 'category__name', 'category__color')
+        .annotate(total=_float_sum(), count=Count('id'))
+        .order_by()
+    )
+    expenses_by_category = []
+    income_by_category = []
+    for x in by_category_rows:
+        target = income_by_category if x['type'] == 'income' else expenses_by_category
+        target.append({
+            'category_id': x['category__uuid'],  # UUID; the renderer encodes it natively
+            'category_name': x['category__name'],
+            'color': x['category__color'],
+            'total': x['total'],
             'count': x['count'],
-        }
-        for x in income_by_category
-    ]
+        })
+    expenses_by_category.sort(key=itemgetter('total'), reverse=True)
+    income_by_category.sort(key=itemgetter('total'), reverse=True)
 
+    # One row per month with income and expense side by side (pivoted in SQL)
     by_month_qs = (
-        Transaction.objects.filter(user=request.user, date__gte=start_date, date__lte=end_date)
+        Transaction.objects.filter(user=request.user, date__range=(start_date, end_date))
         .annotate(month=TruncMonth('date'))
-        .values('month', 'type')
-        .annotate(total=Sum('amount'))
+        .values('month')
+        .annotate(
+            income=_float_sum(type='income'),
+            expense=_float_sum(type='expense'),
+        )
+        .order_by('month')
     )
-    by_month_map = defaultdict(lambda: {'income': 0, 'expense': 0})
-    for row in by_month_qs:
-        month_key = row['month'].strftime('%Y-%m') if row['month'] else None
-        if month_key:
-            by_month_map[month_key][row['type']] = float(row['total'] or 0)
-    months_sorted = sorted(by_month_map.keys())
     by_month = [
-        {'month': m, 'income': by_month_map[m]['income'], 'expense': by_month_map[m]['expense']}
-        for m in months_sorted
+        {
+            'month': row['month'].strftime('%Y-%m'),
+            'income': row['income'],
+            'expense': row['expense'],
+        }
+        for row in by_month_qs
     ]
 
-    return Response({
+    payload = {
         'period': {'start_date': start_date.isoformat(), 'end_date': end_date.isoformat()},
         'summary': {
-            'total_income': float(total_income),
-            'total_expense': float(total_expense),
-            'balance': float(balance),
+            'total_income': total_income,
+            'total_expense': total_expense,
+            'balance': balance,
             'transaction_count': transaction_count,
             'income_count': income_count,
             'expense_count': expense_count,
@@ -437,4 +601,6 @@ def analytics_summary(request):
         'expenses_by_category': expenses_by_category,
         'income_by_category': income_by_category,
         'by_month': by_month,
-    })
\ No newline at end of file
+    }
+    cache.set(cache_key, payload, ANALYTICS_TIMEOUT)
+    return Response(payload)
\ No newline at end of file